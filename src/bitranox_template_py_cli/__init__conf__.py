@@ -57,6 +57,15 @@ LAYEREDCONF_APP: str = "bitranox_template_py_cli"
 #: Configuration slug for lib_layered_config Linux paths and environment variables
 LAYEREDCONF_SLUG: str = "bitranox-template-py-cli"
 
+#: Field labels rendered by :func:`print_info`, in display order.
+_INFO_LABELS: tuple[str, ...] = ("name", "title", "version", "homepage", "author", "author_email", "shell_command")
+#: Column width that aligns the ``=`` signs of the info block.
+_INFO_PAD: int = max(len(label) for label in _INFO_LABELS)
+#: The whole info block with labels pre-padded; rendering is one ``%`` substitution.
+_INFO_TEMPLATE: str = "Info for %(name)s:\n\n" + "".join(
+    f"    {label.ljust(_INFO_PAD)} = %({label})s\n" for label in _INFO_LABELS
+)
+
 
 def print_info() -> None:
     """Print the summarised metadata block used by the CLI ``info`` command.
@@ -75,16 +84,15 @@ def print_info() -> None:
     ...
     """
 
-    fields = [
-        ("name", name),
-        ("title", title),
-        ("version", version),
-        ("homepage", homepage),
-        ("author", author),
-        ("author_email", author_email),
-        ("shell_command", shell_command),
-    ]
-    pad = max(len(label) for label, _ in fields)
-    lines = [f"Info for {name}:", ""]
-    lines.extend(f"    {label.ljust(pad)} = {value}" for label, value in fields)
-    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.write(
+        _INFO_TEMPLATE
+        % {
+            "name": name,
+            "title": title,
+            "version": version,
+            "homepage": homepage,
+            "author": author,
+            "author_email": author_email,
+            "shell_command": shell_command,
+        }
+    )
@@ -33,12 +33,20 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: Accepted option values, taken from the enums so each ``click.Choice`` and the
+#: value -> member lookups below always cover the same set of members.
+_OUTPUT_FORMAT_CHOICES: tuple[str, ...] = tuple(f.value for f in OutputFormat)
+_DEPLOY_TARGET_CHOICES: tuple[str, ...] = tuple(t.value for t in DeployTarget)
+#: Lower-cased value -> member indexes; a dict hit is cheaper than ``Enum(value)``.
+_OUTPUT_FORMAT_BY_VALUE: dict[str, OutputFormat] = {f.value.lower(): f for f in OutputFormat}
+_DEPLOY_TARGET_BY_VALUE: dict[str, DeployTarget] = {t.value.lower(): t for t in DeployTarget}
+
 
 @click.command("config", context_settings=CLICK_CONTEXT_SETTINGS)
 @option(
     "--format",
     "output_format",
-    type=click.Choice([f.value for f in OutputFormat], case_sensitive=False),
+    type=click.Choice(_OUTPUT_FORMAT_CHOICES, case_sensitive=False),
     default=OutputFormat.HUMAN.value,
     help="Output format (human-readable or JSON)",
 )
@@ -71,14 +79,12 @@ def cli_config(ctx: click.Context, output_format: str, section: str | None, prof
     """
     cli_ctx = get_cli_context(ctx)
     effective_config, effective_profile = _resolve_config(cli_ctx, profile)
-    fmt = OutputFormat(output_format.lower())
+    fmt = _OUTPUT_FORMAT_BY_VALUE[output_format.lower()]
 
-    extra = {"command": "config", "format": fmt.value, "profile": effective_profile}
+    # One payload serves both the bound job context and the log record.
+    extra = {"command": "config", "format": fmt.value, "section": section, "profile": effective_profile}
     with lib_log_rich.runtime.bind(job_id="cli-config", extra=extra):
-        logger.info(
-            "Displaying configuration",
-            extra={"format": fmt.value, "section": section, "profile": effective_profile},
-        )
+        logger.info("Displaying configuration", extra=extra)
         safe_console.echo()
         try:
             cli_ctx.services.display_config(
@@ -142,7 +148,7 @@ def _parse_octal_mode(ctx: click.Context, param: click.Parameter, value: str | N
 @option(
     "--target",
     "targets",
-    type=click.Choice([t.value for t in DeployTarget], case_sensitive=False),
+    type=click.Choice(_DEPLOY_TARGET_CHOICES, case_sensitive=False),
     multiple=True,
     required=True,
     help="Target configuration layer(s) to deploy to (can specify multiple)",
@@ -214,15 +220,12 @@ def cli_config_deploy(
     """
     cli_ctx = get_cli_context(ctx)
     effective_profile = _get_effective_profile(cli_ctx, profile)
-    deploy_targets = tuple(DeployTarget(t.lower()) for t in targets)
+    deploy_targets = tuple(_DEPLOY_TARGET_BY_VALUE[t.lower()] for t in targets)
     target_values = tuple(t.value for t in deploy_targets)
 
     extra = {"command": "config-deploy", "targets": target_values, "force": force, "profile": effective_profile}
     with lib_log_rich.runtime.bind(job_id="cli-config-deploy", extra=extra):
-        logger.info(
-            "Deploying configuration",
-            extra={"targets": target_values, "force": force, "profile": effective_profile},
-        )
+        logger.info("Deploying configuration", extra=extra)
         _execute_deploy(
             cli_ctx,
             targets=deploy_targets,
@@ -296,15 +299,18 @@ def _report_deployment_result(deployed_paths: list[Path], profile: str | None, s
     if deployed_paths:
         profile_msg = f" (profile: {profile})" if profile else ""
         perm_msg = "" if set_permissions else " (permissions not set)"
-        safe_console.echo(f"\nConfiguration deployed successfully{profile_msg}{perm_msg}:")
-        for path in deployed_paths:
-            # ASCII marker on purpose: a non-ASCII glyph here crashes config-deploy with a
-            # UnicodeEncodeError on a legacy Windows console codepage (cp1252) even though the
-            # files were already written, so exit 1 misreports a deploy that actually succeeded.
-            safe_console.echo(f"  + {path}")
+        lines = [f"\nConfiguration deployed successfully{profile_msg}{perm_msg}:"]
+        # ASCII marker on purpose: a non-ASCII glyph here crashes config-deploy with a
+        # UnicodeEncodeError on a legacy Windows console codepage (cp1252) even though the
+        # files were already written, so exit 1 misreports a deploy that actually succeeded.
+        lines.extend(f"  + {path}" for path in deployed_paths)
+        # One write for the whole report instead of one per deployed file.
+        safe_console.echo("\n".join(lines))
     else:
-        safe_console.echo("\nNo files were created (all target files already exist).")
-        safe_console.echo("Use --force to overwrite existing configuration files.")
+        safe_console.echo(
+            "\nNo files were created (all target files already exist).\n"
+            "Use --force to overwrite existing configuration files."
+        )
 
 
 @click.command("config-generate-examples", context_settings=CLICK_CONTEXT_SETTINGS)
@@ -328,7 +334,7 @@ def cli_config_generate_examples(ctx: click.Context, destination: str, force: bo
     """
     extra = {"command": "config-generate-examples", "destination": destination, "force": force}
     with lib_log_rich.runtime.bind(job_id="cli-config-generate-examples", extra=extra):
-        logger.info("Generating example configuration files", extra={"destination": destination, "force": force})
+        logger.info("Generating example configuration files", extra=extra)
         try:
             paths = generate_examples(
                 destination=destination,
@@ -338,9 +344,9 @@ def cli_config_generate_examples(ctx: click.Context, destination: str, force: bo
                 force=force,
             )
             if paths:
-                safe_console.echo(f"\nGenerated {len(paths)} example file(s):")
-                for p in paths:
-                    safe_console.echo(f"  {p}")
+                lines = [f"\nGenerated {len(paths)} example file(s):"]
+                lines.extend(f"  {p}" for p in paths)
+                safe_console.echo("\n".join(lines))
             else:
                 safe_console.echo("\nNo files generated (all already exist). Use --force to overwrite.")
         except Exception as exc:
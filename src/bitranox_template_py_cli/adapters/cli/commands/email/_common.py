@@ -6,11 +6,12 @@ shared between send-email and send-notification commands.
 
 from __future__ import annotations
 
-import functools
 import logging
 import os
 from typing import TYPE_CHECKING, Any, cast
 
+from pydantic import ValidationError
+
 from bitranox_template_py_cli import __init__conf__
 from bitranox_template_py_cli.adapters.email.sender import EmailConfig
 from bitranox_template_py_cli.domain.errors import ConfigurationError, DeliveryError
@@ -20,45 +21,43 @@ from ...exit_codes import ExitCode
 from ...typed_click import option
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from lib_layered_config import Config
-    from pydantic import ValidationError
 
     from bitranox_template_py_cli.application.ports import LoadEmailConfigFromDict
 
 logger = logging.getLogger(__name__)
 
 
-def filter_sentinels(**kwargs: Any) -> dict[str, Any]:
+def filter_sentinels(values: Mapping[str, Any]) -> dict[str, Any]:
     """Filter out None and empty tuple sentinels, converting tuples to lists.
 
-    Used to prepare CLI option overrides for ``_apply_validated_overrides()``.
+    Used to prepare CLI option overrides for ``apply_validated_overrides()``.
     Removes None values (unset options) and empty tuples (unset multiple options),
     and converts non-empty tuples to lists for Pydantic compatibility.
 
     Args:
-        **kwargs: Keyword arguments to filter.
+        values: Raw option values keyed by EmailConfig field name.
 
     Returns:
         Filtered dict with sentinel values removed and tuples converted to lists.
     """
-    result: dict[str, Any] = {}
-    for k, v in kwargs.items():
-        if v is None or v == ():
-            continue
-        if isinstance(v, tuple):
-            result[k] = list(cast("tuple[Any, ...]", v))
-        else:
-            result[k] = v
-    return result
+    return {
+        k: list(cast("tuple[Any, ...]", v)) if isinstance(v, tuple) else v
+        for k, v in values.items()
+        if v is not None and v != ()
+    }
 
 
 def apply_validated_overrides(base_config: EmailConfig, overrides: dict[str, Any]) -> EmailConfig:
     """Apply overrides with full Pydantic validation.
 
     Uses model_validate() with a merged dict instead of model_copy(update=...)
-    to ensure Pydantic validators run on all overridden values.
+    to ensure Pydantic validators run on all overridden values. The base
+    values are read straight off the frozen model rather than through
+    ``model_dump()``, which would walk the serializer for every field only
+    to hand the same objects back.
 
     Args:
         base_config: Base EmailConfig to merge overrides into.
@@ -72,41 +71,52 @@ def apply_validated_overrides(base_config: EmailConfig, overrides: dict[str, Any
     """
     if not overrides:
         return base_config
-    base_dict = base_config.model_dump()
-    merged = {**base_dict, **overrides}
+    merged = dict(base_config)
+    merged.update(overrides)
     return EmailConfig.model_validate(merged)
 
 
+#: SMTP override options, built once at import and shared by every email command.
+#: Stored bottom-up (reverse ``--help`` order) so applying them in sequence stacks
+#: them exactly like the equivalent ``@option`` decorator lines would.
+_SMTP_OPTIONS_BOTTOM_UP: tuple[Callable[[Callable[..., Any]], Callable[..., Any]], ...] = tuple(
+    reversed(
+        (
+            option(
+                "--smtp-host",
+                "smtp_hosts",
+                multiple=True,
+                default=(),
+                help="Override SMTP host (can specify multiple; format host:port)",
+            ),
+            option("--smtp-username", default=None, help="Override SMTP authentication username"),
+            option("--smtp-password", default=None, help="Override SMTP authentication password"),
+            option("--use-starttls/--no-use-starttls", default=None, help="Override STARTTLS setting"),
+            option("--timeout", "timeout", type=float, default=None, help="Override socket timeout in seconds"),
+            option(
+                "--raise-on-missing-attachments/--no-raise-on-missing-attachments",
+                default=None,
+                help="Override missing attachment handling",
+            ),
+            option(
+                "--raise-on-invalid-recipient/--no-raise-on-invalid-recipient",
+                default=None,
+                help="Override invalid recipient handling",
+            ),
+        )
+    )
+)
+
+
 def smtp_config_options(func: Callable[..., Any]) -> Callable[..., Any]:
     """Apply shared SMTP configuration override options to a Click command.
 
     Adds CLI flags for all EmailConfig fields so that any TOML setting
     can be overridden at invocation time.
     """
-    options = [
-        option(
-            "--smtp-host",
-            "smtp_hosts",
-            multiple=True,
-            default=(),
-            help="Override SMTP host (can specify multiple; format host:port)",
-        ),
-        option("--smtp-username", default=None, help="Override SMTP authentication username"),
-        option("--smtp-password", default=None, help="Override SMTP authentication password"),
-        option("--use-starttls/--no-use-starttls", default=None, help="Override STARTTLS setting"),
-        option("--timeout", "timeout", type=float, default=None, help="Override socket timeout in seconds"),
-        option(
-            "--raise-on-missing-attachments/--no-raise-on-missing-attachments",
-            default=None,
-            help="Override missing attachment handling",
-        ),
-        option(
-            "--raise-on-invalid-recipient/--no-raise-on-invalid-recipient",
-            default=None,
-            help="Override invalid recipient handling",
-        ),
-    ]
-    return functools.reduce(lambda f, opt: opt(f), reversed(options), func)
+    for apply_option in _SMTP_OPTIONS_BOTTOM_UP:
+        func = apply_option(func)
+    return func
 
 
 def load_and_validate_email_config(config: Config, loader: LoadEmailConfigFromDict) -> EmailConfig:
@@ -135,6 +145,32 @@ def load_and_validate_email_config(config: Config, loader: LoadEmailConfigFromDi
     return email_config
 
 
+def resolve_email_config(config: Config, loader: LoadEmailConfigFromDict, **smtp_overrides: Any) -> EmailConfig:
+    """Load the email config and apply the command's SMTP override options.
+
+    Shared by every email command so the load, sentinel filtering and
+    validated merge happen in one place.
+
+    Args:
+        config: Already-loaded layered configuration object.
+        loader: Function to load EmailConfig from dict.
+        **smtp_overrides: Raw values of the ``smtp_config_options`` flags.
+
+    Returns:
+        EmailConfig with any CLI overrides applied and validated.
+
+    Raises:
+        SystemExit: When SMTP hosts are not configured or an override is invalid.
+    """
+    email_config = load_and_validate_email_config(config, loader)
+    overrides = filter_sentinels(smtp_overrides)
+    try:
+        email_config = apply_validated_overrides(email_config, overrides)
+    except ValidationError as exc:
+        handle_validation_error(exc)
+    return email_config
+
+
 def execute_with_email_error_handling(
     *,
     operation: Callable[[], bool],
@@ -284,5 +320,6 @@ __all__ = [
     "filter_sentinels",
     "handle_validation_error",
     "load_and_validate_email_config",
+    "resolve_email_config",
     "smtp_config_options",
 ]
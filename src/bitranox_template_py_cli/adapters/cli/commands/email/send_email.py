@@ -11,48 +11,15 @@ from pathlib import Path
 
 import lib_log_rich.runtime
 import rich_click as click
-from pydantic import ValidationError
 
 from ...constants import CLICK_CONTEXT_SETTINGS
 from ...context import get_cli_context
 from ...typed_click import option
-from ._common import (
-    apply_validated_overrides,
-    execute_with_email_error_handling,
-    filter_sentinels,
-    handle_validation_error,
-    load_and_validate_email_config,
-    smtp_config_options,
-)
+from ._common import execute_with_email_error_handling, resolve_email_config, smtp_config_options
 
 logger = logging.getLogger(__name__)
 
 
-def _log_send_email_start(
-    recipients: list[str] | None,
-    subject: str,
-    body_html: str,
-    attachments: tuple[str, ...],
-) -> None:
-    """Log the start of an email send operation.
-
-    Args:
-        recipients: Email recipients, or None when using config defaults.
-        subject: Email subject.
-        body_html: HTML body content.
-        attachments: Attachment file paths.
-    """
-    logger.info(
-        "Sending email",
-        extra={
-            "recipients": recipients,
-            "subject": subject,
-            "has_html": bool(body_html),
-            "attachment_count": len(attachments) if attachments else 0,
-        },
-    )
-
-
 @click.command("send-email", context_settings=CLICK_CONTEXT_SETTINGS)
 @option(
     "--to",
@@ -69,7 +36,7 @@ def _log_send_email_start(
     "--attachment",
     "attachments",
     multiple=True,
-    type=click.Path(path_type=str),
+    type=click.Path(path_type=Path),
     help="File to attach (can specify multiple)",
 )
 @smtp_config_options
@@ -82,7 +49,7 @@ def cli_send_email(
     body: str,
     body_html: str,
     from_address: str | None,
-    attachments: tuple[str, ...],
+    attachments: tuple[Path, ...],
     smtp_hosts: tuple[str, ...],
     smtp_username: str | None,
     smtp_password: str | None,
@@ -103,8 +70,9 @@ def cli_send_email(
     extra = {"command": "send-email", "recipients": resolved_recipients, "subject": subject}
 
     with lib_log_rich.runtime.bind(job_id="cli-send-email", extra=extra):
-        email_config = load_and_validate_email_config(cli_ctx.config, cli_ctx.services.load_email_config_from_dict)
-        overrides = filter_sentinels(
+        email_config = resolve_email_config(
+            cli_ctx.config,
+            cli_ctx.services.load_email_config_from_dict,
             smtp_hosts=smtp_hosts,
             smtp_username=smtp_username,
             smtp_password=smtp_password,
@@ -113,13 +81,17 @@ def cli_send_email(
             raise_on_missing_attachments=raise_on_missing_attachments,
             raise_on_invalid_recipient=raise_on_invalid_recipient,
         )
-        try:
-            email_config = apply_validated_overrides(email_config, overrides)
-        except ValidationError as exc:
-            handle_validation_error(exc)
-        attachment_paths = [Path(p) for p in attachments] if attachments else None
-
-        _log_send_email_start(resolved_recipients, subject, body_html, attachments)
+        attachment_paths = list(attachments) if attachments else None
+
+        logger.info(
+            "Sending email",
+            extra={
+                "recipients": resolved_recipients,
+                "subject": subject,
+                "has_html": bool(body_html),
+                "attachment_count": len(attachments),
+            },
+        )
         execute_with_email_error_handling(
             operation=functools.partial(
                 cli_ctx.services.send_email,
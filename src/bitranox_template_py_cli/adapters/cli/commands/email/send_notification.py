@@ -10,19 +10,11 @@ import logging
 
 import lib_log_rich.runtime
 import rich_click as click
-from pydantic import ValidationError
 
 from ...constants import CLICK_CONTEXT_SETTINGS
 from ...context import get_cli_context
 from ...typed_click import option
-from ._common import (
-    apply_validated_overrides,
-    execute_with_email_error_handling,
-    filter_sentinels,
-    handle_validation_error,
-    load_and_validate_email_config,
-    smtp_config_options,
-)
+from ._common import execute_with_email_error_handling, resolve_email_config, smtp_config_options
 
 logger = logging.getLogger(__name__)
 
@@ -67,8 +59,9 @@ def cli_send_notification(
     extra = {"command": "send-notification", "recipients": resolved_recipients, "subject": subject}
 
     with lib_log_rich.runtime.bind(job_id="cli-send-notification", extra=extra):
-        email_config = load_and_validate_email_config(cli_ctx.config, cli_ctx.services.load_email_config_from_dict)
-        overrides = filter_sentinels(
+        email_config = resolve_email_config(
+            cli_ctx.config,
+            cli_ctx.services.load_email_config_from_dict,
             smtp_hosts=smtp_hosts,
             smtp_username=smtp_username,
             smtp_password=smtp_password,
@@ -77,10 +70,6 @@ def cli_send_notification(
             raise_on_missing_attachments=raise_on_missing_attachments,
             raise_on_invalid_recipient=raise_on_invalid_recipient,
         )
-        try:
-            email_config = apply_validated_overrides(email_config, overrides)
-        except ValidationError as exc:
-            handle_validation_error(exc)
         logger.info("Sending notification", extra={"recipients": resolved_recipients, "subject": subject})
         execute_with_email_error_handling(
             operation=functools.partial(
@@ -17,7 +17,7 @@ TracebackState = tuple[bool, bool]
 """Captured traceback configuration: (traceback_enabled, force_color)."""
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class CLIContext:
     """Typed CLI context for Click subcommand access."""
 
@@ -122,10 +122,8 @@ def snapshot_traceback_state() -> TracebackState:
         >>> isinstance(state, tuple) and len(state) == 2
         True
     """
-    return (
-        bool(getattr(lib_cli_exit_tools.config, "traceback", False)),
-        bool(getattr(lib_cli_exit_tools.config, "traceback_force_color", False)),
-    )
+    config = lib_cli_exit_tools.config
+    return (bool(config.traceback), bool(config.traceback_force_color))
 
 
 def restore_traceback_state(state: TracebackState) -> None:
@@ -46,7 +46,8 @@ def _run_cli(argv: Sequence[str] | None, *, services_factory: Callable[[], AppSe
 
     # Use Click's native invocation with obj parameter since lib_cli_exit_tools.run_cli
     # doesn't support passing obj. We replicate its behavior while adding obj support.
-    args = list(argv) if argv is not None else sys.argv[1:]
+    # Click copies ``args`` into its own list, so there is no need to copy here.
+    args = argv if argv is not None else sys.argv[1:]
 
     try:
         cli.main(
@@ -65,7 +66,7 @@ def _run_cli(argv: Sequence[str] | None, *, services_factory: Callable[[], AppSe
         # Catch BaseException (not just Exception) to handle SystemExit, KeyboardInterrupt,
         # and all errors at the CLI boundary. This ensures consistent error formatting via
         # lib_cli_exit_tools regardless of exception type. Intentional, not a bug.
-        tracebacks_enabled = bool(getattr(lib_cli_exit_tools.config, "traceback", False))
+        tracebacks_enabled = bool(lib_cli_exit_tools.config.traceback)
         apply_traceback_preferences(tracebacks_enabled)
         length_limit = TRACEBACK_VERBOSE_LIMIT if tracebacks_enabled else TRACEBACK_SUMMARY_LIMIT
         lib_cli_exit_tools.print_exception_message(trace_back=tracebacks_enabled, length_limit=length_limit)
@@ -8,12 +8,13 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from btx_lib_mail import validate_email_address, validate_smtp_host
-from btx_lib_mail.lib_mail import ConfMail
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+if TYPE_CHECKING:
+    from btx_lib_mail.lib_mail import ConfMail
+
 
 class EmailConfig(BaseModel):
     """Validated, immutable email configuration.
@@ -162,6 +163,8 @@ class EmailConfig(BaseModel):
             ...
             ValidationError: ...
         """
+        from btx_lib_mail import validate_email_address, validate_smtp_host  # noqa: PLC0415 - deferred: btx_lib_mail loads on first config validation
+
         if self.timeout <= 0:
             raise ValueError(f"timeout must be positive, got {self.timeout}")
 
@@ -215,6 +218,8 @@ class EmailConfig(BaseModel):
             >>> conf.smtphosts
             ['smtp.example.com']
         """
+        from btx_lib_mail.lib_mail import ConfMail  # noqa: PLC0415 - deferred: only needed when handing settings to btx_lib_mail
+
         # Build kwargs, omitting None values to use library defaults
         kwargs: dict[str, Any] = {
             "smtphosts": self.smtp_hosts,
@@ -7,18 +7,17 @@ SMTP communication via btx_lib_mail.
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from btx_lib_mail.lib_mail import Transport
-from btx_lib_mail.lib_mail import send as btx_send
-
 from bitranox_template_py_cli.domain.errors import ConfigurationError, DeliveryError
 
 from .validation import validate_recipients
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-    from pathlib import Path
+    from collections.abc import Iterable, Sequence
+
+    from btx_lib_mail.lib_mail import ConfMail, Transport
 
     from .config import EmailConfig
 
@@ -98,24 +97,28 @@ def _resolve_recipients(
 ) -> list[str]:
     """Normalize recipients from override or config default.
 
+    Exact duplicate addresses are dropped, keeping the first occurrence, so a
+    recipient named twice gets one RCPT TO and one copy of the message.
+
     Args:
         config: Email configuration with optional default recipients.
         recipients: Single address, sequence of addresses, or None for config default.
 
     Returns:
-        Non-empty list of recipient addresses.
+        Non-empty list of unique recipient addresses in first-seen order.
 
     Raises:
         ValueError: When no recipients are available from either source.
         InvalidRecipientError: When a runtime recipient has invalid email format.
     """
-    if recipients is not None:
-        recipient_list = [recipients] if isinstance(recipients, str) else list(recipients)
-        # Validate runtime recipients (config recipients validated by Pydantic)
-        validate_recipients(recipient_list)
+    if recipients is None:
+        source: Sequence[str] = config.recipients
     else:
-        recipient_list = list(config.recipients)
+        # Validate runtime recipients (config recipients validated by Pydantic)
+        validate_recipients(recipients)
+        source = (recipients,) if isinstance(recipients, str) else recipients
 
+    recipient_list = list(dict.fromkeys(source))
     if not recipient_list:
         raise ValueError("No recipients configured and no override provided")
     return recipient_list
@@ -134,6 +137,49 @@ def _validate_smtp_hosts(config: EmailConfig) -> None:
         raise ConfigurationError("No SMTP hosts configured (email.smtp_hosts is empty)")
 
 
+def _is_under(path: Path, directories: Iterable[Path]) -> bool:
+    """Return True when ``path`` lies inside any of ``directories``."""
+    return any(path.is_relative_to(Path(directory).expanduser().resolve()) for directory in directories)
+
+
+def _directory_policy_permits(path: Path, conf: ConfMail) -> bool:
+    """Return True when btx_lib_mail's directory policy clearly allows ``path``.
+
+    Paths the policy blocks, or whose status is unknown because the library
+    leaves its defaults unresolved, return False.
+    """
+    resolved = path.expanduser().resolve()
+    if conf.attachment_allowed_directories:
+        return _is_under(resolved, conf.attachment_allowed_directories)
+    if conf.attachment_blocked_directories is None:
+        return False
+    return not _is_under(resolved, conf.attachment_blocked_directories)
+
+
+def _validate_attachments(config: EmailConfig, attachments: Sequence[Path] | None) -> None:
+    """Fail fast when required attachments are missing, before any SMTP session.
+
+    Checks every path in one pass so the error names all missing files at once.
+    Only paths the directory policy allows are checked; anything else is left
+    to btx_lib_mail, which reports the security violation. A blocked path
+    therefore fails the same way whether or not it exists.
+
+    Args:
+        config: Email configuration; nothing is checked unless
+            ``raise_on_missing_attachments`` is set.
+        attachments: Attachment paths, or None.
+
+    Raises:
+        FileNotFoundError: When one or more permitted attachments are not regular files.
+    """
+    if not attachments or not config.raise_on_missing_attachments:
+        return
+    conf = config.to_conf_mail()
+    missing = [str(path) for path in attachments if _directory_policy_permits(path, conf) and not path.is_file()]
+    if missing:
+        raise FileNotFoundError(f"Attachment file(s) not found: {', '.join(missing)}")
+
+
 def send_email(
     *,
     config: EmailConfig,
@@ -180,9 +226,12 @@ def send_email(
         Sends email via SMTP. Logs send attempts at INFO level and failures
         at ERROR level.
     """
+    from btx_lib_mail.lib_mail import send as btx_send  # noqa: PLC0415 - deferred: btx_lib_mail loads on first send
+
     sender = _resolve_sender(config, from_address)
     _validate_smtp_hosts(config)
     recipient_list = _resolve_recipients(config, recipients)
+    _validate_attachments(config, attachments)
 
     logger.info(
         "Sending email",
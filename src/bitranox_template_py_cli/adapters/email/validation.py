@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from btx_lib_mail import validate_email_address
-
 from bitranox_template_py_cli.domain.errors import InvalidRecipientError
 
 if TYPE_CHECKING:
@@ -32,6 +30,8 @@ def validate_recipient(recipient: str) -> None:
         ...
         InvalidRecipientError: Invalid recipient: invalid
     """
+    from btx_lib_mail import validate_email_address  # noqa: PLC0415 - deferred: btx_lib_mail loads on first recipient check
+
     try:
         validate_email_address(recipient)
     except ValueError as e:
@@ -57,8 +57,10 @@ def validate_recipients(recipients: str | Sequence[str] | None) -> None:
     """
     if recipients is None:
         return
-    recipient_list = [recipients] if isinstance(recipients, str) else list(recipients)
-    for recipient in recipient_list:
+    if isinstance(recipients, str):
+        validate_recipient(recipients)
+        return
+    for recipient in recipients:
         validate_recipient(recipient)
 
 
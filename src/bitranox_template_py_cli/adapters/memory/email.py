@@ -53,6 +53,8 @@ class EmailSpy:
 
     Each test should create its own EmailSpy instance to avoid cross-test pollution.
     The spy's send methods match the Protocol signatures expected by AppServices.
+    Recipients are captured exactly as passed; duplicate addresses are not
+    dropped here the way the SMTP adapter drops them before delivery.
 
     Attributes:
         sent_emails: List of captured send_email calls.
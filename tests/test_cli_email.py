@@ -780,3 +780,29 @@ def test_when_send_notification_receives_negative_timeout_it_exits_invalid_argum
 
     assert result.exit_code == 22
     assert "Invalid option value" in result.output or "timeout must be positive" in result.output
+
+
+# ======================== Override Sentinel Filtering ========================
+
+
+@pytest.mark.os_agnostic
+def test_when_filter_sentinels_receives_a_read_only_mapping_it_returns_a_new_dict() -> None:
+    """filter_sentinels accepts any mapping and returns a fresh dict without unset options."""
+    from types import MappingProxyType
+
+    from bitranox_template_py_cli.adapters.cli.commands.email import filter_sentinels
+
+    values = MappingProxyType(
+        {
+            "smtp_hosts": ("smtp.test.com:587",),
+            "smtp_username": None,
+            "recipients": (),
+            "timeout": 15.0,
+        }
+    )
+
+    result = filter_sentinels(values)
+
+    assert type(result) is dict
+    assert result == {"smtp_hosts": ["smtp.test.com:587"], "timeout": 15.0}
+    assert "smtp_username" in values
@@ -613,6 +613,27 @@ def test_send_email_accepts_multiple_recipients() -> None:
     assert transport.recipients == ["user1@test.com", "user2@test.com"]
 
 
+@pytest.mark.os_agnostic
+def test_send_email_delivers_once_per_distinct_recipient() -> None:
+    """Repeated addresses are sent to once, in first-seen order."""
+    config = EmailConfig(
+        smtp_hosts=["smtp.test.com:587"],
+        from_address="sender@test.com",
+    )
+
+    transport = RecordingTransport()
+    result = send_email(
+        config=config,
+        recipients=["user1@test.com", "user2@test.com", "user1@test.com"],
+        subject="Test Subject",
+        body="Test body",
+        transport=transport,
+    )
+
+    assert result is True
+    assert transport.recipients == ["user1@test.com", "user2@test.com"]
+
+
 @pytest.mark.os_agnostic
 def test_send_email_allows_sender_override() -> None:
     """from_address parameter overrides config default."""
@@ -898,6 +919,92 @@ def test_send_email_raises_when_attachment_missing(tmp_path: Path) -> None:
         )
 
 
+@pytest.mark.os_agnostic
+def test_send_email_lists_every_missing_attachment_before_any_delivery(tmp_path: Path) -> None:
+    """All missing attachments are reported at once and no SMTP host is contacted."""
+    present = tmp_path / "present.txt"
+    present.write_text("content")
+    first_missing = tmp_path / "first.txt"
+    second_missing = tmp_path / "second.txt"
+    transport = RecordingTransport()
+
+    config = EmailConfig(
+        smtp_hosts=["smtp.test.com:587"],
+        from_address="sender@test.com",
+        raise_on_missing_attachments=True,
+        # Disable directory blocking for tests using tmp_path
+        # (macOS tmp_path is under /var which is blocked by default)
+        attachment_blocked_directories=frozenset(),
+    )
+
+    with pytest.raises(FileNotFoundError) as exc_info:
+        send_email(
+            config=config,
+            recipients="recipient@test.com",
+            subject="Test",
+            body="Hello",
+            attachments=[first_missing, present, second_missing],
+            transport=transport,
+        )
+
+    message = str(exc_info.value)
+    assert str(first_missing) in message
+    assert str(second_missing) in message
+    assert str(present) not in message
+    assert transport.attempted_hosts == []
+
+
+@pytest.mark.os_agnostic
+def test_send_email_leaves_blocked_attachments_to_the_security_policy(tmp_path: Path) -> None:
+    """A missing file in a blocked directory is not pre-checked, so its existence is not revealed."""
+    missing = tmp_path / "missing.txt"
+
+    config = EmailConfig(
+        smtp_hosts=["smtp.test.com:587"],
+        from_address="sender@test.com",
+        raise_on_missing_attachments=True,
+        attachment_blocked_directories=frozenset({tmp_path}),
+    )
+
+    with patch("btx_lib_mail.lib_mail.send", return_value=True) as btx_send:
+        send_email(
+            config=config,
+            recipients="recipient@test.com",
+            subject="Test",
+            body="Hello",
+            attachments=[missing],
+        )
+
+    assert btx_send.call_args.kwargs["attachment_file_paths"] == [missing]
+
+
+@pytest.mark.os_agnostic
+def test_send_email_reports_directory_attachment_as_not_found(tmp_path: Path) -> None:
+    """A directory passed as an attachment fails the up-front regular-file check."""
+    transport = RecordingTransport()
+
+    config = EmailConfig(
+        smtp_hosts=["smtp.test.com:587"],
+        from_address="sender@test.com",
+        raise_on_missing_attachments=True,
+        # Disable directory blocking for tests using tmp_path
+        # (macOS tmp_path is under /var which is blocked by default)
+        attachment_blocked_directories=frozenset(),
+    )
+
+    with pytest.raises(FileNotFoundError, match="not found"):
+        send_email(
+            config=config,
+            recipients="recipient@test.com",
+            subject="Test",
+            body="Hello",
+            attachments=[tmp_path],
+            transport=transport,
+        )
+
+    assert transport.attempted_hosts == []
+
+
 @pytest.mark.os_agnostic
 def test_send_email_raises_when_all_smtp_hosts_fail() -> None:
     """All SMTP hosts failing raises DeliveryError."""
@@ -1153,7 +1260,7 @@ def test_send_email_logs_success_on_true_result(caplog: pytest.LogCaptureFixture
     )
 
     with (
-        patch("bitranox_template_py_cli.adapters.email.transport.btx_send", return_value=True),
+        patch("btx_lib_mail.lib_mail.send", return_value=True),
         caplog.at_level(logging.INFO),
     ):
         result = send_email(
@@ -1179,7 +1286,7 @@ def test_send_email_logs_warning_on_false_result(caplog: pytest.LogCaptureFixtur
     )
 
     with (
-        patch("bitranox_template_py_cli.adapters.email.transport.btx_send", return_value=False),
+        patch("btx_lib_mail.lib_mail.send", return_value=False),
         caplog.at_level(logging.WARNING),
     ):
         result = send_email(
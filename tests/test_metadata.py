@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import ast
 from pathlib import Path
 from typing import Any, cast
 
@@ -63,6 +64,26 @@ def test_metadata_constants_are_set() -> None:
     assert __init__conf__.shell_command == "bitranox-template-py-cli"
 
 
+@pytest.mark.os_agnostic
+def test_metadata_module_does_not_query_packaging_metadata() -> None:
+    """__init__conf__ must stay free of importlib.metadata lookups.
+
+    Every CLI start imports this module, and a metadata query re-scans
+    site-packages on each import. The constants are synced from
+    pyproject.toml by test_metadata_sync.py instead.
+    """
+    source = (_get_package_dir() / "__init__conf__.py").read_text(encoding="utf-8")
+    imported: set[str] = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            imported.add(node.module)
+
+    offenders = sorted(module for module in imported if module.startswith(("importlib", "pkg_resources")))
+    assert not offenders, f"__init__conf__ queries packaging metadata at import: {offenders}"
+
+
 @pytest.mark.os_agnostic
 def test_py_typed_marker_exists() -> None:
     """Verify PEP 561 py.typed marker exists in the package source."""
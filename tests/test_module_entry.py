@@ -144,6 +144,32 @@ def test_module_entry_subprocess_version() -> None:
     assert __init__conf__.version in result.stdout
 
 
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize("command", ["hello", "info"])
+def test_non_email_commands_do_not_import_btx_lib_mail(command: str) -> None:
+    """Commands that never send mail leave btx_lib_mail unimported."""
+    script = (
+        "import runpy, sys\n"
+        f"sys.argv = ['bitranox_template_py_cli', {command!r}]\n"
+        "try:\n"
+        "    runpy.run_module('bitranox_template_py_cli', run_name='__main__', alter_sys=True)\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('btx_lib_mail loaded:', 'btx_lib_mail' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        timeout=30,
+        check=False,
+        encoding="utf-8",
+        errors="replace",
+        env=_subprocess_env(),
+    )
+    assert result.returncode == 0, result.stderr
+    assert "btx_lib_mail loaded: False" in result.stdout
+
+
 @pytest.mark.os_agnostic
 def test_entry_main_invokes_cli_with_help(
     monkeypatch: pytest.MonkeyPatch,